@@ -1,165 +1,66 @@
 # src/data/readability.py
-import re
-from typing import Dict, List
-
-#from textComplexityMetrics import TextComplexityMetrics
-#from descriptiveTextMetrics import DescriptiveTextMetrics
-
-class TextComplexityMetrics:
+import functools
+import math
+import weakref
+from bisect import bisect_right
+from typing import Dict, List, Union
+
+import numpy as np
+
+from core.analyze._tokenize import (
+    TokenizedText,
+    count_syllables_ru,
+    extract_words,
+    split_sentences,
+    syllables_per_word,
+    tokenize_batch,
+)
+from core.analyze.descriptiveTextMetrics import DescriptiveTextMetrics as _DescriptiveTextMetrics
+from core.analyze.stats import _BaseTextStats, compute_stats
+from core.analyze.textComplexityMetrics import TextComplexityMetrics
+
+
+# Пороги индекса Флеша и соответствующие уровни (по возрастанию балла)
+_FLESCH_THRESHOLDS = (30, 50, 60, 70, 80, 90)
+_FLESCH_LEVELS = (
+    "очень сложно (академики)",
+    "сложно (студенты)",
+    "довольно сложно (10–11 кл.)",
+    "средне (8–9 кл.)",
+    "довольно легко (6–7 кл.)",
+    "легко (4–5 кл.)",
+    "очень легко (1–3 кл.)",
+)
+# Результаты запоминаются только для коротких текстов: повторяются в корпусах именно строки и фразы,
+# а кэш на 4096 длинных текстов держал бы в памяти сотни МБ самих строк-ключей
+_RESULT_CACHE_MAX_LEN = 4096
+
+
+class DescriptiveTextMetrics(_DescriptiveTextMetrics):
     """
-    Вычисляет базовые метрики сложности текста на русском (и частично — на других языках).
-    Поддерживает гипотезы: короткие предложения + короткие слова → проще текст.
+    Дескриптивные метрики со схемой, которую этот модуль отдавал раньше (и через
+    ReadabilityIndexCalculator().descriptive, и при импорте DescriptiveTextMetrics отсюда):
+    число уникальных слов под ключом "unique_words", а не "Уникальные слова (unique_words)".
+    Сам расчёт — core.analyze.descriptiveTextMetrics.DescriptiveTextMetrics.
     """
 
-    @staticmethod
-    def _split_sentences(text: str) -> List[str]:
-        """Разделяет текст на предложения (учитывает ..., !?, и т.д.)."""
-        # Простой, но robust-подход для русского: точки, восклицания, вопросы — с последующими заглавными
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
-
-    @staticmethod
-    def _split_words(sentence: str) -> List[str]:
-        """Извлекает слова (только буквы и дефисы внутри слов)."""
-        return re.findall(r'\b[а-яА-ЯёЁa-zA-Z]+(?:-[а-яА-ЯёЁa-zA-Z]+)*\b', sentence)
-
-    @staticmethod
-    def _count_syllables_ru(word: str) -> int:
-        """
-        Подсчёт слогов в русском слове по гласным (е, ё, и, о, у, ы, э, ю, я, а).
-        Простая, но эффективная эвристика — подходит для оценки сложности.
-        """
-        word = word.lower()
-        vowels = "аеёиоуыэюя"
-        return max(1, sum(1 for char in word if char in vowels))
-
-    def compute(self, text: str) -> Dict[str, float]:
-        """
-        Возвращает словарь с метриками.
-        Все значения округлены до 2 знаков для воспроизводимости и логгирования.
-        """
-        if not isinstance(text, str) or not text.strip():
-            return {
-                "avg_sentence_length": 0.0,
-                "avg_word_syllables": 0.0,
-                "avg_word_letters": 0.0,
-                # доп. метрики для анализа
-                "sentence_count": 0,
-                "word_count": 0,
-                "char_count": len(text),
-                "confidence_hint": 0.0,
-            }
-
-        sentences = self._split_sentences(text)
-        words = []
-        for sent in sentences:
-            words.extend(self._split_words(sent))
-
-        # 1. Средняя длина предложения (в словах)
-        avg_sent_len = len(words) / len(sentences) if sentences else 0
-
-        # 2. Средняя длина слова в слогах
-        syllables = [self._count_syllables_ru(w) for w in words]
-        avg_syllables = sum(syllables) / len(syllables) if syllables else 0
-
-        # 3. Средняя длина слова в буквах
-        letters = [len(w) for w in words]
-        avg_letters = sum(letters) / len(letters) if letters else 0
-
-        # Confidence: если мало предложений/слов — низкая уверенность
-        confidence = 1.0
-        if len(sentences) < 2:
-            confidence = 0.5
-        if len(words) < 5:
-            confidence = 0.3
+    def from_tok(self, tok: TokenizedText) -> Dict[str, int]:
+        result = super().from_tok(tok)
+        # Порядок ключей сохраняется
+        return {("unique_words" if k == "Уникальные слова (unique_words)" else k): v for k, v in result.items()}
 
-        return {
-            # Основные метрики
-            "Средняя длина предложения (avg_sentence_length)": round(avg_sent_len, 2),
-            "Средняя длина слова (в слогах) (avg_word_syllables)": round(avg_syllables, 2),
-            "Средняя длина слова (в буквах) (аvg_word_letters)": round(avg_letters, 2),
-
-            # Доп. для анализа и фильтрации
-            "sentence_count": len(sentences),
-            "word_count": len(words),
-            "char_count": len(text),
-            "confidence_hint": round(confidence, 2),
-        }
 
-class DescriptiveTextMetrics:
+def _round_like_compute(values: np.ndarray, ndigits: int) -> np.ndarray:
     """
-    Вычисляет дескриптивные параметры текста:
-    - слова vs. словоформы (с учётом повторов)
-    - распределение слов по слогам
-    - структура предложений
-
-    Подходит для анализа сказок, учебных текстов, художественной речи.
+    Поэлементный встроенный round, как в compute.
+    np.round умножает на 10**ndigits и округляет результат, поэтому на границах
+    вида …5 расходится с round (например, 69 / 40 → 1.72 вместо 1.73).
+    Это цикл Python по элементам — ради совпадения с compute, а не ради скорости.
     """
+    return np.array([round(x, ndigits) for x in values.tolist()], dtype=float)
 
-    @staticmethod
-    def _split_sentences(text: str) -> List[str]:
-        """Разделение на предложения (сохраняет надёжность)."""
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
-
-    @staticmethod
-    def _extract_words(text: str) -> List[str]:
-        """Извлекает слова в нижнем регистре, только кириллица + дефис внутри."""
-        return re.findall(r'\b[а-яё]+(?:-[а-яё]+)*\b', text.lower())
-
-    @staticmethod
-    def _count_syllables_ru(word: str) -> int:
-        """Слоги по гласным — как в классе выше, но вынесено для переиспользования."""
-        vowels = "аеёиоуыэюя"
-        return max(1, sum(1 for ch in word if ch in vowels))
 
-    def compute(self, text: str) -> Dict[str, int]:
-        """
-        Возвращает словарь с дескриптивными параметрами.
-        Все значения — целые числа (как в твоей таблице).
-        """
-        if not isinstance(text, str) or not text.strip():
-            return {
-                "word_forms_total": 0,
-                "unique_words": 0,
-                "sentence_count": 0,
-                "monosyllabic_words": 0,
-                "disyllabic_words": 0,
-                "trisyllabic_words": 0,
-                "polysyllabic_words": 0,  # ≥4 слогов
-                "word_syllable_distribution": {},  # например: {1: 6, 2: 8, 3: 5, 4: 7}
-            }
-
-        sentences = self._split_sentences(text)
-        all_words = self._extract_words(text)
-        unique_words = set(all_words)
-
-        # Подсчёт слогов для каждого слова
-        syllable_counts = [self._count_syllables_ru(w) for w in all_words]
-
-        # Группировка по количеству слогов
-        distribution = {}
-        for sc in syllable_counts:
-            distribution[sc] = distribution.get(sc, 0) + 1
-
-        return {
-            # 1–3: основные дескрипторы
-            "word_forms_total": len(all_words),  # 1. словоформы (с повторами)
-            "unique_words": len(unique_words),  # 2. уникальные слова
-            "sentence_count": len(sentences),  # 3. предложений
-
-            # 4–7: распределение по слогам (как в таблице)
-            "monosyllabic_words": distribution.get(1, 0),  # 4. односложных
-            "disyllabic_words": distribution.get(2, 0),  # 5. двусложных
-            "trisyllabic_words": distribution.get(3, 0),  # 6. трёхсложных
-            "polysyllabic_words": sum(v for k, v in distribution.items() if k >= 4),  # 7. ≥4 слогов
-
-            # Дополнительно — для анализа и confidence
-            "word_syllable_distribution": distribution,  # полное распределение: {1:6, 2:8, ...}
-            "lexical_diversity": round(len(unique_words) / len(all_words), 3) if all_words else 0.0,
-        }
-
-class ReadabilityIndexCalculator:
+class ReadabilityIndexCalculator(_BaseTextStats):
     """
     Вычисляет индексы удобочитаемости (читабельности) для русского языка.
     Поддерживает:
@@ -169,36 +70,48 @@ class ReadabilityIndexCalculator:
       • Индекс школьной сложности (Минобрнауки РФ, 2020)
     """
 
-    def __init__(self):
+    _split_sentences = staticmethod(split_sentences)
+    _extract_words = staticmethod(extract_words)
+    _count_syllables_ru = staticmethod(count_syllables_ru)
+
+    def __init__(self, cache_size: int = 4096):
         self.complexity = TextComplexityMetrics()
         self.descriptive = DescriptiveTextMetrics()
+        # Кэш результатов по самому тексту: в корпусах часто повторяются строки и фразы.
+        # Ключ — сама строка (хэш str считается один раз и хранится в объекте),
+        # совпадение проверяется сравнением, так что коллизий нет.
+        # Кэш держит метод через слабую ссылку: связанный self._compute замкнул бы цикл
+        # экземпляр → кэш → метод → экземпляр, и калькулятор освобождался бы только сборщиком циклов.
+        compute_ref = weakref.WeakMethod(self._compute)
+        self._compute_cached = functools.lru_cache(maxsize=cache_size)(lambda text: compute_ref()(text))
+
+    def compute(self, text: Union[str, TokenizedText]) -> Dict[str, float]:
+        # Общий контекст (core.analyze.context.AnalysisContext) уже токенизирован — считаем по нему
+        if isinstance(text, TokenizedText):
+            return self.from_tok(text)
+        if not isinstance(text, str):
+            return self._empty_result()
+        if len(text) > _RESULT_CACHE_MAX_LEN:
+            return self._compute(text)
+        # Копия — чтобы изменения результата вызывающим кодом не портили кэш
+        return dict(self._compute_cached(text))
 
-    def _split_sentences(self, text: str) -> List[str]:
-        return [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
-
-    def _extract_words(self, text: str) -> List[str]:
-        return re.findall(r'\b[а-яё]+(?:-[а-яё]+)*\b', text.lower())
-
-    def _count_syllables_ru(self, word: str) -> int:
-        vowels = "аеёиоуыэюя"
-        return max(1, sum(1 for ch in word if ch in vowels))
+    def _compute(self, text: str) -> Dict[str, float]:
+        return self.from_tok(self._tokenized(text))
 
-    def compute(self, text: str) -> Dict[str, float]:
-        if not isinstance(text, str) or not text.strip():
+    def from_tok(self, tok: TokenizedText) -> Dict[str, float]:
+        """То же, что compute, но по уже токенизированному тексту (см. core.analyze._tokenize.tokenize)."""
+        if tok.is_blank:
             return self._empty_result()
 
-        sentences = self._split_sentences(text)
-        words = self._extract_words(text)
-
-        n_sentences = len(sentences)
-        n_words = len(words)
+        stats = compute_stats(tok)
+        n_sentences = stats["n_sentences"]
+        n_words = stats["n_words"]
         if n_words == 0 or n_sentences == 0:
             return self._empty_result()
 
-        # Слоги и длинные слова (≥4 слогов)
-        syllables = [self._count_syllables_ru(w) for w in words]
-        n_syllables = sum(syllables)
-        polysyllables = sum(1 for s in syllables if s >= 3)  # ≥3 слогов — как в русских адаптациях
+        n_syllables = stats["n_syllables"]
+        polysyllables = stats["n_poly3"]  # ≥3 слогов — как в русских адаптациях
 
         # 1. Адаптированный индекс Флеша для русского (по методике Н. Ю. Сыромятниковой)
         # FRE = 206.835 − 1.3 * (слоги/слово) − 60.1 * (предл./слово)
@@ -210,7 +123,7 @@ class ReadabilityIndexCalculator:
         # 2. SMOG (Simple Measure of Gobbledygook) — адаптация для русского
         # SMOG = 1.043 * sqrt(30 * polysyllables / n_sentences) + 3.1291
         if n_sentences >= 10:
-            smog = 1.043 * ((30.0 * polysyllables / n_sentences) ** 0.5) + 3.1291
+            smog = 1.043 * math.sqrt(30.0 * polysyllables / n_sentences) + 3.1291
         else:
             # для коротких текстов — линейная аппроксимация
             smog = 1.0 + 0.1 * polysyllables
@@ -220,9 +133,9 @@ class ReadabilityIndexCalculator:
         #   +0.5 за каждое предложение > 15 слов
         #   +1.0 за каждое слово ≥4 слогов
         #   +0.2 за каждое слово ≥7 букв
-        long_sentences = sum(1 for s in sentences if len(self._extract_words(s)) > 15)
-        long_words = sum(1 for w in words if len(w) >= 7)
-        polysyllables_4 = sum(1 for s in syllables if s >= 4)
+        long_sentences = stats["n_long_sentences"]
+        long_words = stats["n_long_words"]
+        polysyllables_4 = stats["n_poly4"]
         simple_score = 0.5 * long_sentences + 1.0 * polysyllables_4 + 0.2 * long_words
         simple_level = min(5.0, max(1.0, 1.0 + simple_score / 5.0))
 
@@ -233,12 +146,11 @@ class ReadabilityIndexCalculator:
 
         # Интерпретация (для логов и confidence)
         flesch_level = self._interpret_flesch(flesch)
-        smog_grade = round(smog, 1)
 
         return {
             # Основные индексы
             "flesch_reading_ease": round(flesch, 1),  # 0–100: ↑ = легче
-            "smog_grade": round(smog_grade, 1),  # ≈ класс школы
+            "smog_grade": round(smog, 1),  # ≈ класс школы
             "simple_level": round(simple_level, 1),  # 1–5: ↑ = сложнее
             "school_grade": round(school_level, 1),  # 1–12: класс
 
@@ -256,22 +168,67 @@ class ReadabilityIndexCalculator:
             "confidence_hint": 1.0 if n_words >= 20 else 0.6,
         }
 
+    def compute_batch(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Пакетный вариант compute: те же ключи, значения — массивы формы (len(texts),).
+        Все тексты токенизируются одним проходом, формулы считаются выражениями NumPy,
+        поэтому подходит как колбэк для datasets.map(batched=True).
+        """
+        n = len(texts)
+        words, word_docs, sentence_docs, words_per_sentence = tokenize_batch(texts)
+        syllables = syllables_per_word(words)
+        lengths = np.fromiter(map(len, words), dtype=np.intp, count=len(words))
+
+        n_words = np.bincount(word_docs, minlength=n)
+        n_sentences = np.bincount(sentence_docs, minlength=n)
+        n_syllables = np.bincount(word_docs, weights=syllables, minlength=n)
+        polysyllables = np.bincount(word_docs[syllables >= 3], minlength=n)
+        polysyllables_4 = np.bincount(word_docs[syllables >= 4], minlength=n)
+        long_words = np.bincount(word_docs[lengths >= 7], minlength=n)
+        long_sentences = np.bincount(sentence_docs[words_per_sentence > 15], minlength=n)
+        valid = (n_words > 0) & (n_sentences > 0)
+
+        # Те же формулы, что и в compute; для пустых текстов делители заменяются на 1
+        safe_words = np.maximum(n_words, 1)
+        safe_sentences = np.maximum(n_sentences, 1)
+        asl = n_words / safe_sentences
+        asw = n_syllables / safe_words
+        flesch = np.clip(206.835 - 1.3 * asw - 60.1 * (n_sentences / safe_words), 0.0, 100.0)
+        smog = np.where(
+            n_sentences >= 10,
+            1.043 * ((30.0 * polysyllables / safe_sentences) ** 0.5) + 3.1291,
+            1.0 + 0.1 * polysyllables,
+        )
+        simple_score = 0.5 * long_sentences + 1.0 * polysyllables_4 + 0.2 * long_words
+        simple_level = np.clip(1.0 + simple_score / 5.0, 1.0, 5.0)
+        school_level = np.clip(0.39 * asl + 11.8 * asw - 15.59, 1.0, 12.0)
+        flesch_level = np.array(_FLESCH_LEVELS, dtype=object)[
+            np.searchsorted(_FLESCH_THRESHOLDS, flesch, side="right")
+        ]
+
+        result = {
+            "flesch_reading_ease": _round_like_compute(flesch, 1),
+            "smog_grade": _round_like_compute(smog, 1),
+            "simple_level": _round_like_compute(simple_level, 1),
+            "school_grade": _round_like_compute(school_level, 1),
+            "avg_sentence_words": _round_like_compute(asl, 2),
+            "avg_word_syllables": _round_like_compute(asw, 2),
+            "polysyllabic_words_ge3": polysyllables,
+            "polysyllabic_words_ge4": polysyllables_4,
+            "long_sentences_gt15": long_sentences,
+            "long_words_ge7": long_words,
+            "flesch_level": flesch_level,
+            "is_child_friendly": (flesch >= 70.0) & (simple_level <= 2.5),
+            "confidence_hint": np.where(n_words >= 20, 1.0, 0.6),
+        }
+        # Пустые тексты получают значения из _empty_result, как в compute
+        empty = self._empty_result()
+        return {k: np.where(valid, v, empty[k]).astype(v.dtype) for k, v in result.items()}
+
     @staticmethod
     def _interpret_flesch(score: float) -> str:
-        if score >= 90:
-            return "очень легко (1–3 кл.)"
-        elif score >= 80:
-            return "легко (4–5 кл.)"
-        elif score >= 70:
-            return "довольно легко (6–7 кл.)"
-        elif score >= 60:
-            return "средне (8–9 кл.)"
-        elif score >= 50:
-            return "довольно сложно (10–11 кл.)"
-        elif score >= 30:
-            return "сложно (студенты)"
-        else:
-            return "очень сложно (академики)"
+        # Двоичный поиск по порогам вместо цепочки сравнений; порог включается в верхний уровень
+        return _FLESCH_LEVELS[bisect_right(_FLESCH_THRESHOLDS, score)]
 
     @staticmethod
     def _empty_result() -> Dict[str, float]:
@@ -0,0 +1,44 @@
+import threading
+import warnings
+
+# Один MorphAnalyzer на процесс: словари pymorphy3 занимают десятки МБ и грузятся заметное время,
+# поэтому все анализаторы используют общий экземпляр, созданный при первом обращении
+_morph = None
+_morph_lock = threading.Lock()
+
+
+def get_morph():
+    """Возвращает общий pymorphy3.MorphAnalyzer (создаётся лениво, один раз)."""
+    global _morph
+    if _morph is None:
+        with _morph_lock:
+            if _morph is None:
+                import pymorphy3
+                from pymorphy3 import dawg
+
+                if not dawg.EXTENSION_AVAILABLE:
+                    # Без C-расширения словари читаются чистым Python (DAWG-Python) — разбор в разы медленнее
+                    warnings.warn(
+                        "pymorphy3 работает без C-расширения DAWG: морфологический разбор будет медленным. "
+                        "Установите пакет DAWG2 (pip install DAWG2).",
+                        RuntimeWarning,
+                        # Указываем на это место, а не на вызывающего: get_morph вызывают и конструкторы
+                        # анализаторов, и фоновый поток прогрева в main.py
+                        stacklevel=1,
+                    )
+                # Конвейер анализаторов — по умолчанию. Урезание блоков, которые не срабатывают на строчной
+                # кириллице (числа, латиница, пунктуация, дефисные слова, инициалы), разборы не меняет, но и
+                # не ускоряет: время уходит на словарь и предсказатели по префиксу/суффиксу. Оценщик P(t|w)
+                # тоже нужен — он определяет порядок разборов, а берётся самый вероятный.
+                _morph = pymorphy3.MorphAnalyzer()
+    return _morph
+
+
+def parse_best(word: str):
+    """
+    Самый вероятный разбор слова (pymorphy3 Parse) или None, если разборов нет.
+    Здесь не кэшируется: вызывающий код кэширует то, что извлёк из разбора
+    (см. morpho_metrics._word_features), а не сами объекты Parse.
+    """
+    parses = get_morph().parse(word)
+    return parses[0] if parses else None
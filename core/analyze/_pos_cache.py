@@ -0,0 +1,97 @@
+import atexit
+import logging
+import os
+import pickle
+import threading
+from typing import Any, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Каталог кэша. Кэш на диске включается только явно — заданием BERT_TEXT_COMPLEXITY_CACHE_DIR:
+# pickle исполняет код при загрузке, поэтому читать его можно лишь из каталога, выбранного
+# самим пользователем, а не из общего места по умолчанию. Без переменной (или с пустым
+# значением) разборы кэшируются только в памяти процесса.
+_ENV_CACHE_DIR = "BERT_TEXT_COMPLEXITY_CACHE_DIR"
+# Предел записей: кэш не должен бесконечно расти на больших корпусах
+_MAX_ENTRIES = 1_000_000
+
+
+def _cache_dir() -> Optional[str]:
+    return os.environ.get(_ENV_CACHE_DIR) or None
+
+
+def _morph_signature() -> tuple:
+    """Версия pymorphy3 и словаря: при их смене сохранённые разборы становятся недействительными."""
+    import pymorphy3
+    from core.analyze._morph import get_morph
+
+    return pymorphy3.__version__, get_morph().dictionary.meta.get("compiled_at")
+
+
+class PersistentCache:
+    """
+    Словарь «слово → результат разбора», который сохраняется между запусками (pickle).
+    Работает, только если задан BERT_TEXT_COMPLEXITY_CACHE_DIR; иначе get всегда возвращает None,
+    а set ничего не делает. Файл читается при первом обращении и записывается при выходе из процесса,
+    если появились новые записи. Запись идёт во временный файл с последующей заменой,
+    поэтому прерванный запуск не портит кэш. Любая ошибка чтения/записи — просто пустой кэш.
+    """
+
+    def __init__(self, name: str, version: int):
+        self.name = name
+        self.version = version
+        self._data: Optional[Dict[Hashable, Any]] = None
+        self._enabled = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Optional[str]:
+        cache_dir = _cache_dir()
+        return os.path.join(cache_dir, f"{self.name}.pickle") if cache_dir else None
+
+    def _header(self) -> tuple:
+        return (self.name, self.version) + _morph_signature()
+
+    def _load(self) -> Dict[Hashable, Any]:
+        with self._lock:
+            if self._data is None:
+                data = {}
+                path = self.path
+                self._enabled = path is not None
+                if path and os.path.exists(path):
+                    try:
+                        with open(path, "rb") as f:
+                            header, stored = pickle.load(f)
+                        if header == self._header() and isinstance(stored, dict):
+                            data = stored
+                    except Exception as exc:  # повреждённый или чужой файл — начинаем с пустого кэша
+                        logger.warning("Не удалось прочитать кэш %s: %s", path, exc)
+                self._data = data
+                if self._enabled:
+                    atexit.register(self.save)
+        return self._data
+
+    def get(self, key: Hashable) -> Any:
+        data = self._data if self._data is not None else self._load()
+        return data.get(key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        data = self._data if self._data is not None else self._load()
+        if self._enabled and len(data) < _MAX_ENTRIES:
+            data[key] = value
+            self._dirty = True
+
+    def save(self) -> None:
+        path = self.path
+        if not self._dirty or not path or self._data is None:
+            return
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump((self._header(), dict(self._data)), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            self._dirty = False
+        except OSError as exc:
+            logger.warning("Не удалось сохранить кэш %s: %s", path, exc)
@@ -0,0 +1,56 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+C-ускоренный подсчёт слогов по гласным (необязательное расширение).
+Сборка: python setup.py build_ext --inplace
+Если модуль не собран, core.analyze._tokenize использует NumPy-реализацию.
+"""
+import numpy as np
+
+# Таблица «гласная?» по кодам символов 0x000–0x4FF (латиница + кириллица)
+cdef bint vowel_lut[0x500]
+
+for _ch in "аеёиоуыэюяАЕЁИОУЫЭЮЯ":
+    vowel_lut[ord(_ch)] = True
+
+
+cdef inline bint _is_vowel(Py_UCS4 ch) noexcept nogil:
+    return ch < 0x500 and vowel_lut[ch]
+
+
+def count_syllables(str word) -> int:
+    """Количество гласных в слове (минимум 1) — как count_syllables_ru."""
+    cdef Py_ssize_t n = 0
+    cdef Py_UCS4 ch
+    for ch in word:
+        if _is_vowel(ch):
+            n += 1
+    return n if n > 1 else 1
+
+
+def syllables_per_word(str text, const Py_ssize_t[:] word_starts, const Py_ssize_t[:] word_ends):
+    """
+    Слоги для каждого слова text[word_starts[k]:word_ends[k]] (минимум 1).
+    Возвращает np.ndarray (intp) той же длины, что и word_starts.
+    """
+    cdef Py_ssize_t n_words = word_starts.shape[0]
+    cdef Py_ssize_t text_len = len(text)
+    out = np.empty(n_words, dtype=np.intp)
+    cdef Py_ssize_t[::1] res = out
+    cdef Py_ssize_t k, i, start, end, n
+    cdef Py_UCS4 ch
+
+    if word_ends.shape[0] != n_words:
+        raise ValueError("word_starts и word_ends должны быть одной длины")
+
+    for k in range(n_words):
+        start = word_starts[k]
+        end = word_ends[k]
+        if start < 0 or end > text_len or start > end:
+            raise IndexError("границы слова вне текста")
+        n = 0
+        for i in range(start, end):
+            ch = text[i]
+            if _is_vowel(ch):
+                n += 1
+        res[k] = n if n > 1 else 1
+    return out
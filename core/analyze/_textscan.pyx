@@ -0,0 +1,101 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Однопроходный C-счётчик базовой статистики текста для индексов удобочитаемости (необязательное расширение).
+Сборка: python setup.py build_ext --inplace
+Если модуль не собран, core.analyze.stats считает те же величины через регулярки и NumPy.
+"""
+from cpython.unicode cimport Py_UNICODE_ISALNUM, Py_UNICODE_ISSPACE
+
+
+cdef inline bint _is_cyr(Py_UCS4 ch) noexcept nogil:
+    # [а-яё]
+    return (0x430 <= ch <= 0x44F) or ch == 0x451
+
+
+cdef inline bint _is_vowel(Py_UCS4 ch) noexcept nogil:
+    return (ch == u'а' or ch == u'е' or ch == u'ё' or ch == u'и' or ch == u'о'
+            or ch == u'у' or ch == u'ы' or ch == u'э' or ch == u'ю' or ch == u'я')
+
+
+cdef inline bint _is_term(Py_UCS4 ch) noexcept nogil:
+    return ch == u'.' or ch == u'!' or ch == u'?'
+
+
+cdef inline bint _is_word_char(Py_UCS4 ch) noexcept:
+    # \w регулярок Python для str: буква/цифра Unicode или '_'
+    return ch == u'_' or Py_UNICODE_ISALNUM(ch)
+
+
+def scan(str text_lower) -> tuple:
+    """
+    Один проход по тексту в нижнем регистре. Слова — как \\b[а-яё]+(?:-[а-яё]+)*\\b,
+    предложения — как split_sentences, слоги — по гласным (минимум 1 на слово).
+    Возвращает (n_words, n_sentences, n_syllables, n_poly3, n_poly4,
+    n_long_words, n_long_sentences) — в том же порядке, что и compute_stats.
+    """
+    cdef Py_ssize_t n = len(text_lower)
+    cdef Py_ssize_t i = 0, j, k, m, end, p
+    cdef Py_UCS4 ch
+    cdef long n_words = 0, n_sentences = 0, n_syllables = 0
+    cdef long n_poly3 = 0, n_poly4 = 0, n_long_words = 0, n_long_sentences = 0
+    cdef long segment_words = 0, vowels
+    cdef bint segment_has_content = False
+
+    while i < n:
+        ch = text_lower[i]
+        if _is_term(ch):
+            # Серия разделителей закрывает фрагмент (и предложение, если в нём есть непробельные символы)
+            while i < n and _is_term(text_lower[i]):
+                i += 1
+            if segment_has_content:
+                n_sentences += 1
+            if segment_words > 15:
+                n_long_sentences += 1
+            segment_has_content = False
+            segment_words = 0
+            continue
+        if not Py_UNICODE_ISSPACE(ch):
+            segment_has_content = True
+        if _is_cyr(ch) and (i == 0 or not _is_word_char(text_lower[i - 1])):
+            # Кириллическая серия, затем «-серия» сколько получится; слово заканчивается
+            # на последней границе, за которой нет \w (как при откате регулярки)
+            j = i + 1
+            while j < n and _is_cyr(text_lower[j]):
+                j += 1
+            end = j if (j == n or not _is_word_char(text_lower[j])) else -1
+            k = j
+            while k + 1 < n and text_lower[k] == u'-' and _is_cyr(text_lower[k + 1]):
+                m = k + 2
+                while m < n and _is_cyr(text_lower[m]):
+                    m += 1
+                if m == n or not _is_word_char(text_lower[m]):
+                    end = m
+                k = m
+            if end < 0:
+                # Внутри серии граница слова невозможна — следующая попытка с её конца
+                i = j
+                continue
+            vowels = 0
+            for p in range(i, end):
+                if _is_vowel(text_lower[p]):
+                    vowels += 1
+            if vowels < 1:
+                vowels = 1
+            n_words += 1
+            segment_words += 1
+            n_syllables += vowels
+            if vowels >= 3:
+                n_poly3 += 1
+            if vowels >= 4:
+                n_poly4 += 1
+            if end - i >= 7:
+                n_long_words += 1
+            i = end
+            continue
+        i += 1
+
+    if segment_has_content:
+        n_sentences += 1
+    if segment_words > 15:
+        n_long_sentences += 1
+    return (n_words, n_sentences, n_syllables, n_poly3, n_poly4, n_long_words, n_long_sentences)
@@ -0,0 +1,300 @@
+import codecs
+import re
+from functools import cached_property
+from itertools import compress
+from operator import itemgetter
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    # Необязательное C-расширение: python setup.py build_ext --inplace
+    from core.analyze import _syllables as _syllables_ext
+except ImportError:
+    _syllables_ext = None
+
+# Шаблоны компилируются один раз при импорте и переиспользуются всеми анализаторами.
+# Движок — стандартный re: в RE2 (google-re2) \b и \w только ASCII, кириллица не считается буквой,
+# а на оставшихся шаблонах ([.!?]+, «[^»]*») обёртка RE2 в 5–20 раз медленнее из-за перекодирования в UTF-8.
+_SENT_RE = re.compile(r'[.!?]+')
+# Непустое предложение: от первого непробельного символа до ближайшего разделителя [.!?]
+_SENT_BODY_RE = re.compile(r'[^.!?\s][^.!?]*')
+_WORD_RE_MIXED = re.compile(r'\b[а-яА-ЯёЁa-zA-Z]+(?:-[а-яА-ЯёЁa-zA-Z]+)*\b')
+_WORD_RE_RUCYR = re.compile(r'\b[а-яё]+(?:-[а-яё]+)*\b')
+# Слова без дефиса — для морфологического разбора (MorphoMetrics, AnalysisContext)
+_WORD_RE_RUCYR_SIMPLE = re.compile(r'\b[а-яё]+\b')
+# Слово (группа 1) или разделитель предложений (пустая группа) — для однопроходного разбора
+_WORD_OR_SENT_RE = re.compile(r'(\b[а-яё]+(?:-[а-яё]+)*\b)|[.!?]+')
+# Пакетный разбор: слово | разделитель предложений | граница документа | прочие непробельные символы.
+# Тип токена однозначно определяется его первым символом.
+_BATCH_TOKEN_RE = re.compile(r'\b[а-яё]+(?:-[а-яё]+)*\b|[.!?]+|\x00|[^\s.!?\x00а-яё]+')
+_DOC_SEP = '\x00'
+
+_VOWELS = "аеёиоуыэюя"
+# Таблица для str.translate: удаляет гласные, счёт идёт на уровне C, без цикла по символам
+_VOWEL_DELETE = str.maketrans('', '', _VOWELS + _VOWELS.upper())
+# Булева таблица «гласная?» по кодам символов (латиница + кириллица, 0x000–0x4FF)
+_VOWEL_CODES = np.array([ord(c) for c in _VOWELS + _VOWELS.upper()], dtype=np.uint32)
+_VOWEL_LUT = np.zeros(0x500, dtype=bool)
+_VOWEL_LUT[_VOWEL_CODES] = True
+
+# Быстрое извлечение слов без регулярки: текст кодируется в cp1251 (кириллица — один байт),
+# байты перекодируются таблицей в три класса: кириллица и дефис остаются как есть,
+# прочие «буквенные» символы (\w) становятся меткой '0', всё остальное — пробелом.
+# Дальше слова получаются обычным str.split(). На коротких текстах накладные расходы
+# больше выигрыша, поэтому ниже порога используется findall.
+_TRANSLATE_MIN_LEN = 512
+# Векторный подсчёт слогов стоит ~20 мкс на вызов независимо от размера; на меньшем числе слов
+# дешевле посчитать каждое слово через str.translate
+_SYLLABLES_VECTOR_MIN_WORDS = 24
+_RUCYR = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+_WORDCHAR_MARK = ord('0')
+_HYPHEN = ord('-')
+_SPACE = ord(' ')
+
+
+def _wordchar_errors(err: UnicodeEncodeError) -> Tuple[str, int]:
+    """Обработчик ошибок кодирования: символы вне cp1251 сводятся к метке '0' или пробелу."""
+    chunk = err.object[err.start:err.end]
+    return ''.join('0' if ch.isalnum() or ch == '_' else ' ' for ch in chunk), err.end
+
+
+codecs.register_error('bert_text_complexity.wordchar', _wordchar_errors)
+
+
+def _build_cp1251_tables() -> Tuple[np.ndarray, np.ndarray]:
+    classes = np.full(256, _SPACE, dtype=np.uint8)
+    is_cyr = np.zeros(256, dtype=bool)
+    for b in range(256):
+        ch = bytes([b]).decode('cp1251', errors='replace')
+        if ch in _RUCYR:
+            classes[b] = b
+            is_cyr[b] = True
+        elif ch == '-':
+            classes[b] = b
+        elif ch.isalnum() or ch == '_':
+            classes[b] = _WORDCHAR_MARK
+    return classes, is_cyr
+
+
+_CP1251_CLASSES, _CP1251_IS_CYR = _build_cp1251_tables()
+
+
+def split_sentences(text: str) -> List[str]:
+    """Разделяет текст на предложения (учитывает ..., !?, и т.д.)."""
+    return [s.strip() for s in _SENT_RE.split(text) if s.strip()]
+
+
+def count_sentences(text: str) -> int:
+    """Количество предложений как len(split_sentences(text)), но без списка обрезанных строк."""
+    return len(_SENT_BODY_RE.findall(text))
+
+
+def split_words(sentence: str) -> List[str]:
+    """Извлекает слова (только буквы и дефисы внутри слов), регистр сохраняется."""
+    return _WORD_RE_MIXED.findall(sentence)
+
+
+def extract_words(text: str) -> List[str]:
+    """Извлекает слова в нижнем регистре, только кириллица + дефис внутри."""
+    return extract_words_lower(text.lower())
+
+
+def extract_words_lower(text_lower: str) -> List[str]:
+    """Как extract_words, но для уже приведённого к нижнему регистру текста (без лишней копии)."""
+    if len(text_lower) < _TRANSLATE_MIN_LEN:
+        return _WORD_RE_RUCYR.findall(text_lower)
+    encoded = text_lower.encode('cp1251', 'bert_text_complexity.wordchar')
+    classes = _CP1251_CLASSES[np.frombuffer(encoded, dtype=np.uint8)]
+    is_cyr = _CP1251_IS_CYR[classes]
+
+    # Кириллица вплотную к другой букве (латиница, цифра, «_») — \b не сработает,
+    # такие случаи разбираем регуляркой
+    is_mark = classes == _WORDCHAR_MARK
+    if is_mark.any():
+        if (is_mark[1:] & is_cyr[:-1]).any() or (is_mark[:-1] & is_cyr[1:]).any():
+            return _WORD_RE_RUCYR.findall(text_lower)
+        classes[is_mark] = _SPACE
+
+    # Дефис остаётся частью слова, только если с обеих сторон кириллица
+    is_hyphen = classes == _HYPHEN
+    if is_hyphen.any():
+        inner = np.zeros_like(is_hyphen)
+        inner[1:-1] = is_cyr[:-2] & is_cyr[2:]
+        classes[is_hyphen & ~inner] = _SPACE
+    return classes.tobytes().decode('cp1251').split()
+
+
+def extract_simple_words_lower(text_lower: str) -> List[str]:
+    """Кириллические слова без дефисных соединений (дефис разделяет слова); текст в нижнем регистре."""
+    return _WORD_RE_RUCYR_SIMPLE.findall(text_lower)
+
+
+def extract_words_per_sentence(text_lower: str) -> Tuple[List[str], List[int]]:
+    """
+    За один проход регулярки возвращает слова (как extract_words)
+    и количество слов в каждом фрагменте между разделителями [.!?]+.
+    Ожидает текст в нижнем регистре.
+    """
+    tokens = _WORD_OR_SENT_RE.findall(text_lower)
+    words = [t for t in tokens if t]
+    words_per_sentence = []
+    n = 0
+    for t in tokens:
+        if t:
+            n += 1
+        else:
+            words_per_sentence.append(n)
+            n = 0
+    words_per_sentence.append(n)
+    return words, words_per_sentence
+
+
+def tokenize_batch(texts: Sequence[str]) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Токенизирует пачку текстов одним проходом регулярки по склеенной через '\\x00' строке.
+    Возвращает:
+      • words — все слова (как extract_words) подряд по документам;
+      • word_docs — номер документа для каждого слова;
+      • sentence_docs — номер документа для каждого непустого предложения (как split_sentences);
+      • words_per_sentence — количество слов в каждом из этих предложений.
+    Не-строки считаются пустыми текстами.
+    """
+    joined = _DOC_SEP.join(
+        t.replace(_DOC_SEP, '\x01') if isinstance(t, str) else '' for t in texts
+    ).lower()
+    tokens = _BATCH_TOKEN_RE.findall(joined)
+    if not tokens:
+        empty = np.zeros(0, dtype=np.intp)
+        return [], empty, empty, empty
+
+    # Классификация токенов по первому символу — без цикла на Python
+    first = np.frombuffer(''.join(map(itemgetter(0), tokens)).encode('utf-32-le'), dtype=np.uint32)
+    is_sep = first == 0
+    is_term = (first == ord('.')) | (first == ord('!')) | (first == ord('?'))
+    is_word = ((first >= ord('а')) & (first <= ord('я'))) | (first == ord('ё'))
+    is_content = ~(is_sep | is_term)
+
+    doc_id = np.cumsum(is_sep)
+    segment_id = np.cumsum(is_sep | is_term)
+
+    # Предложение непустое, если в его фрагменте есть хотя бы один содержательный токен
+    content_segments = segment_id[is_content]
+    sentence_starts = np.flatnonzero(np.diff(content_segments, prepend=-1))
+    sentence_docs = doc_id[is_content][sentence_starts]
+    if len(sentence_starts):
+        words_per_sentence = np.add.reduceat(is_word[is_content].astype(np.intp), sentence_starts)
+    else:
+        words_per_sentence = np.zeros(0, dtype=np.intp)
+
+    words = list(compress(tokens, is_word.tolist()))
+    return words, doc_id[is_word], sentence_docs, words_per_sentence
+
+
+def count_syllables_ru(word: str) -> int:
+    """
+    Подсчёт слогов в русском слове по гласным (е, ё, и, о, у, ы, э, ю, я, а).
+    Простая, но эффективная эвристика — подходит для оценки сложности.
+    Считается каждая гласная, а не группа подряд идущих гласных: в русском языке
+    соседние гласные образуют разные слоги (ау-ди-то-ри-я, по-э-ма), дифтонгов нет.
+    """
+    if _syllables_ext is not None:
+        return _syllables_ext.count_syllables(word)
+    return max(1, len(word) - len(word.translate(_VOWEL_DELETE)))
+
+
+def syllables_per_word(words: Sequence[str]) -> np.ndarray:
+    """
+    Векторный вариант count_syllables_ru для списка слов.
+    Без C-расширения короткие списки считаются по словам (см. _SYLLABLES_VECTOR_MIN_WORDS).
+    Слова склеиваются в одну строку, гласные отмечаются по UCS-4 кодам через таблицу,
+    а количество гласных в каждом слове — разность кумулятивных сумм на его границах.
+    """
+    n = len(words)
+    if not n:
+        return np.zeros(0, dtype=np.intp)
+    if _syllables_ext is None and n < _SYLLABLES_VECTOR_MIN_WORDS:
+        return np.fromiter(map(count_syllables_ru, words), dtype=np.intp, count=n)
+    lengths = np.fromiter(map(len, words), dtype=np.intp, count=n)
+    ends = np.cumsum(lengths)
+    joined = ''.join(words)
+    if _syllables_ext is not None:
+        return _syllables_ext.syllables_per_word(joined, ends - lengths, ends)
+    codes = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32)
+    # Коды вне таблицы сводим к 0x4FF («ӿ») — это не гласная
+    is_vowel = _VOWEL_LUT[np.minimum(codes, 0x4FF)]
+    vowels_cum = np.concatenate(([0], np.cumsum(is_vowel, dtype=np.intp)))
+    return np.maximum(vowels_cum[ends] - vowels_cum[ends - lengths], 1)
+
+
+class TokenizedText:
+    """
+    Результат токенизации одного текста, общий для всех анализаторов.
+    Каждое представление (предложения, слова, слоги) вычисляется при первом обращении
+    и дальше переиспользуется — текст не разбирается повторно в каждом классе метрик.
+    Последовательности хранятся кортежами: их разделяют несколько анализаторов,
+    и случайное изменение в одном из них не должно влиять на остальные.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @cached_property
+    def is_blank(self) -> bool:
+        return not self.text.strip()
+
+    @cached_property
+    def sentences(self) -> Tuple[str, ...]:
+        return tuple(split_sentences(self.text))
+
+    @cached_property
+    def n_sentences(self) -> int:
+        # Если предложения уже выделены — берём их число, иначе считаем без построения списка
+        if 'sentences' in self.__dict__:
+            return len(self.sentences)
+        return count_sentences(self.text)
+
+    @cached_property
+    def text_lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def words(self) -> Tuple[str, ...]:
+        """Слова в нижнем регистре, только кириллица (как extract_words)."""
+        return tuple(extract_words_lower(self.text_lower))
+
+    @cached_property
+    def n_words(self) -> int:
+        return len(self.words)
+
+    @cached_property
+    def words_per_sentence(self) -> Tuple[int, ...]:
+        """Количество слов во фрагментах между разделителями [.!?]+."""
+        words, words_per_sentence = extract_words_per_sentence(self.text_lower)
+        # Слова получены тем же проходом — заполняем кэш words, если он ещё пуст
+        self.__dict__.setdefault('words', tuple(words))
+        return tuple(words_per_sentence)
+
+    @cached_property
+    def syllables(self) -> np.ndarray:
+        """Количество слогов в каждом слове из words."""
+        return syllables_per_word(self.words)
+
+    @cached_property
+    def word_lengths(self) -> np.ndarray:
+        """Длина каждого слова из words (в символах) — столбец для векторных подсчётов."""
+        return np.fromiter(map(len, self.words), dtype=np.intp, count=self.n_words)
+
+    @cached_property
+    def sentence_words(self) -> Tuple[str, ...]:
+        """Слова с сохранением регистра (кириллица и латиница) по всем предложениям, как split_words."""
+        return tuple(w for sent in self.sentences for w in split_words(sent))
+
+    @cached_property
+    def sentence_word_syllables(self) -> np.ndarray:
+        return syllables_per_word(self.sentence_words)
+
+
+def tokenize(text: str) -> TokenizedText:
+    """Создаёт общий объект токенизации для передачи в from_tok анализаторов."""
+    return TokenizedText(text)
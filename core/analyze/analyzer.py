@@ -0,0 +1,37 @@
+from typing import Dict
+
+from core.analyze.context import AnalysisContext
+from core.analyze.ReadabilityIndexCalculator import ReadabilityIndexCalculator
+from core.analyze.descriptiveTextMetrics import DescriptiveTextMetrics
+from core.analyze.morpho_metrics import MorphoMetrics
+from core.analyze.textComplexityMetrics import TextComplexityMetrics
+
+
+class Analyzer:
+    """
+    Считает все семейства метрик (сложность, дескриптивные, морфология, удобочитаемость) по одному тексту.
+    Текст токенизируется один раз, общий AnalysisContext передаётся в from_tok каждого анализатора.
+    """
+
+    def __init__(self):
+        self.complexity = TextComplexityMetrics()
+        self.descriptive = DescriptiveTextMetrics()
+        self.morpho = MorphoMetrics()
+        self.readability = ReadabilityIndexCalculator()
+
+    def analyze(self, text: str) -> Dict[str, Dict]:
+        """
+        Возвращает метрики, сгруппированные по анализаторам.
+        Ключи у анализаторов частично совпадают (sentence_count, confidence_hint),
+        поэтому результаты не сливаются в один словарь.
+        Для не-строк — TypeError: не все анализаторы умеют возвращать пустой результат для них.
+        """
+        if not isinstance(text, str):
+            raise TypeError(f"Analyzer.analyze ожидает str, получено {type(text).__name__}")
+        ctx = AnalysisContext(text)
+        return {
+            "complexity": self.complexity.from_tok(ctx),
+            "descriptive": self.descriptive.from_tok(ctx),
+            "morpho": self.morpho.from_tok(ctx),
+            "readability": self.readability.from_tok(ctx),
+        }
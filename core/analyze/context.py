@@ -0,0 +1,18 @@
+from functools import cached_property
+from typing import Tuple
+
+from core.analyze._tokenize import TokenizedText, extract_simple_words_lower
+
+
+class AnalysisContext(TokenizedText):
+    """
+    Общий контекст анализа одного текста для всех четырёх анализаторов.
+    Создаётся один раз и передаётся в compute каждого из них вместо строки:
+    предложения, слова, слоги и слова для морфологии вычисляются при первом обращении
+    и переиспользуются, поэтому текст не разбирается заново в каждом анализаторе.
+    """
+
+    @cached_property
+    def morph_words(self) -> Tuple[str, ...]:
+        """Кириллические слова в нижнем регистре для морфологического разбора (без дефисных)."""
+        return tuple(extract_simple_words_lower(self.text_lower))
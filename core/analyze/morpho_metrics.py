@@ -1,130 +1,177 @@
 # src/data/morpho_metrics.py
+import functools
 import re
-from collections import Counter, defaultdict
-from typing import Dict, List, Set, Tuple
+import warnings
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-import pymorphy2
+import numpy as np
 
+from core.analyze._morph import get_morph, parse_best
+from core.analyze._pos_cache import PersistentCache
+from core.analyze._tokenize import TokenizedText, extract_simple_words_lower
+from core.analyze.context import AnalysisContext
 
-class MorphoMetrics:
-    """
-    Анализ частеречной структуры текста на русском языке.
-    Поддерживает: существительные, глаголы, прилагательные, местоимения, наречия и др.
-    Возвращает количества, доли и признаки для гипотез (например: "сказки → много глаголов совершенного вида").
-    """
+_QUOTE_RE = re.compile(r'«[^»]*»')
+_DASH_LINE_RE = re.compile(r'^\s*—', re.MULTILINE)
+# Суффиксы уменьшительно-ласкательных форм (проверяются по нормальной форме)
+_DIM_SUFFIXES = ("очк", "еньк", "оньк", "ушк", "ышк", "ичк")
+# Индексы частей речи для подсчёта через np.bincount; всё прочее (и UNKNOWN) — в _POS_OTHER
+_POS_IDX = {
+    "NOUN": 0, "NPRO": 1, "VERB": 2, "INFN": 3, "GRND": 4, "ADJF": 5, "PRTF": 6, "NUMR": 7,
+    "ADVB": 8, "PREP": 9, "CONJ": 10, "PRCL": 11, "INTJ": 12, "ADJPRO": 13, "PRTFPRO": 14,
+}
+_POS_OTHER = len(_POS_IDX)
 
-    def __init__(self, cache_size: int = 100_000):
-        self.morph = pymorphy2.MorphAnalyzer()
-        # Опционально: кэш для ускорения повторяющихся слов (актуально для сказок с повторами)
-        self._cache = {}
-        self._cache_size = cache_size
 
-    def _normalize_word(self, word: str) -> str:
-        return re.sub(r'[^а-яё]', '', word.lower())
+# Признаки слов, сохраняемые между запусками. version увеличивается при любом изменении
+# _POS_IDX, _DIM_SUFFIXES или состава признаков в _parse_features
+_FEATURES_DISK_CACHE = PersistentCache("morpho_features", version=1)
 
-    def _get_pos(self, word: str) -> str:
-        """Возвращает часть речи (POS) для слова: NOUN, VERB, ADJF и т.д."""
-        if not word:
-            return "UNKNOWN"
 
-        if word in self._cache:
-            return self._cache[word]
+@functools.lru_cache(maxsize=200_000)
+def _word_features(word: str) -> Tuple[int, Optional[str], bool, bool, bool]:
+    """
+    Всё, что MorphoMetrics берёт из разбора слова, в компактном виде:
+    (код POS, лемма или None, глагол?, совершенный вид?, уменьшительная форма?).
+    Это единственный кэш разборов: хранится кортеж признаков по словоформе, а не объекты Parse;
+    если включён кэш на диске (см. _pos_cache), слова из прошлых запусков берутся оттуда.
+    """
+    features = _FEATURES_DISK_CACHE.get(word)
+    if features is None:
+        features = _parse_features(word)
+        _FEATURES_DISK_CACHE.set(word, features)
+    return features
+
+
+def _parse_features(word: str) -> Tuple[int, Optional[str], bool, bool, bool]:
+    parse = parse_best(word)
+    if parse is None:
+        return _POS_OTHER, None, False, False, word.endswith(_DIM_SUFFIXES)
+    tag = parse.tag
+    pos = tag.POS
+    norm = parse.normal_form
+    is_verb = pos in ("VERB", "INFN")
+    return (
+        _POS_IDX.get(pos, _POS_OTHER),
+        norm,
+        is_verb,
+        is_verb and tag.aspect == "perf",
+        norm.endswith(_DIM_SUFFIXES),
+    )
 
-        parsed = self.morph.parse(word)
-        if not parsed:
-            pos = "UNKNOWN"
-        else:
-            # Берём самый вероятный разбор
-            pos = parsed[0].tag.POS or "UNKNOWN"
 
-        # Ограничиваем кэш
-        if len(self._cache) < self._cache_size:
-            self._cache[word] = pos
+class MorphoMetrics:
+    """
+    Анализ частеречной структуры текста на русском языке.
+    Поддерживает: существительные, глаголы, прилагательные, местоимения, наречия и др.
+    Возвращает количества, доли и признаки для гипотез (например: "сказки → много глаголов совершенного вида").
+    """
 
-        return pos
+    def __init__(self, cache_size: Optional[int] = None):
+        if cache_size is not None:
+            # Признаки слов кэшируются на уровне модуля (_word_features), размер кэша экземпляра не задаётся
+            warnings.warn(
+                "Параметр cache_size у MorphoMetrics больше не используется и будет удалён.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        self.morph = get_morph()
 
     def _extract_words(self, text: str) -> List[str]:
-        """Извлекает только кириллические слова (без пунктуации, цифр)."""
-        return re.findall(r'\b[а-яё]+\b', text.lower())
+        """
+        Извлекает только кириллические слова (без пунктуации, цифр).
+        Латиница, числа и смешанные токены (PostgreSQL, 2PC, IVF-PQ) отсекаются здесь же,
+        поэтому до морфологического разбора доходят только русские слова.
+        """
+        return self._extract_words_lower(text.lower())
 
-    def compute(self, text: str) -> Dict[str, int]:
+    @staticmethod
+    def _extract_words_lower(text_lower: str) -> List[str]:
+        """Как _extract_words, но для текста, уже приведённого к нижнему регистру."""
+        return extract_simple_words_lower(text_lower)
+
+    def compute(self, text: Union[str, TokenizedText]) -> Dict[str, int]:
         """
         Возвращает дескрипторы по частям речи.
         Все значения — целые числа или доли (float).
+        Вместо строки можно передать токенизированный текст или общий AnalysisContext.
+        """
+        if isinstance(text, TokenizedText):
+            return self.from_tok(text)
+        return self._compute_words(text, self._extract_words(text))
+
+    def from_tok(self, tok: TokenizedText) -> Dict[str, int]:
         """
-        words = self._extract_words(text)
+        То же, что compute, но по уже токенизированному тексту.
+        У AnalysisContext слова уже извлечены; для простого TokenizedText они берутся из text_lower.
+        """
+        if isinstance(tok, AnalysisContext):
+            words = tok.morph_words
+        else:
+            words = self._extract_words_lower(tok.text_lower)
+        return self._compute_words(tok.text, words)
+
+    def _compute_words(self, text: str, words: Sequence[str]) -> Dict[str, int]:
         if not words:
             return self._empty_result()
 
-        pos_list = [self._get_pos(w) for w in words]
-        pos_counter = Counter(pos_list)
+        # Признаки слова берутся из кэша (разбор — один раз на словоформу) и раскладываются по столбцам:
+        # коды POS в int8-массив для np.bincount, флаги — в кортежи для sum
+        pos_ids, lemmas, is_verb, is_perfective, is_diminutive = zip(*map(_word_features, words))
+        pos_codes = np.fromiter(pos_ids, dtype=np.int8, count=len(pos_ids))
+        counts = np.bincount(pos_codes, minlength=_POS_OTHER + 1).tolist()
+        (n_noun, n_npro, n_verb, n_infn, n_grnd, n_adjf, n_prtf, n_numr,
+         n_advb, n_prep, n_conj, n_prcl, n_intj, n_adjpro, n_prtfpro, _) = counts
+        verb_count = sum(is_verb)
+        perfective_count = sum(is_perfective)
+        diminutive_count = sum(is_diminutive)
+        lemmas = set(lemmas)
+        lemmas.discard(None)  # слова без разбора леммы не дают
 
         # Группировка по семантическим классам (как в лингвистике)
-        noun_like = pos_counter["NOUN"] + pos_counter["NPRO"]  # NPRO = местоим-сущ (он, она, это)
-        verb_like = pos_counter["VERB"] + pos_counter["INFN"] + pos_counter["GRND"]  # инфинитив, деепричастие
-        adj_like = pos_counter["ADJF"] + pos_counter["PRTF"] + pos_counter["NUMR"]  # причастие, числительное как прил.
-        adv_like = pos_counter["ADVB"]
-        pronouns = pos_counter["NPRO"] + pos_counter["ADJPRO"] + pos_counter["PRTFPRO"]  # личные, притяж., отн.
+        noun_like = n_noun + n_npro  # NPRO = местоим-сущ (он, она, это)
+        verb_like = n_verb + n_infn + n_grnd  # инфинитив, деепричастие
+        adj_like = n_adjf + n_prtf + n_numr  # причастие, числительное как прил.
+        adv_like = n_advb
+        pronouns = n_npro + n_adjpro + n_prtfpro  # личные, притяж., отн.
 
         total = len(words)
 
         return {
             # Абсолютные количества (твои «существительные, глаголы и т.д.»)
-            "nouns": pos_counter["NOUN"],
-            "verbs": pos_counter["VERB"],
-            "adjectives": pos_counter["ADJF"],
+            "nouns": n_noun,
+            "verbs": n_verb,
+            "adjectives": n_adjf,
             "pronouns": pronouns,
-            "adverbs": pos_counter["ADVB"],
-            "prepositions": pos_counter["PREP"],
-            "conjunctions": pos_counter["CONJ"],
-            "particles": pos_counter["PRCL"],
-            "interjections": pos_counter["INTJ"],
+            "adverbs": n_advb,
+            "prepositions": n_prep,
+            "conjunctions": n_conj,
+            "particles": n_prcl,
+            "interjections": n_intj,
 
             # Производные — для гипотез и confidence
-            "noun_ratio": round(pos_counter["NOUN"] / total, 3) if total else 0.0,
-            "verb_ratio": round(pos_counter["VERB"] / total, 3) if total else 0.0,
-            "adj_ratio": round(pos_counter["ADJF"] / total, 3) if total else 0.0,
+            "noun_ratio": round(n_noun / total, 3) if total else 0.0,
+            "verb_ratio": round(n_verb / total, 3) if total else 0.0,
+            "adj_ratio": round(n_adjf / total, 3) if total else 0.0,
 
             # Специфичные для сказок / сложности:
-            "verb_perfective_ratio": self._compute_perfective_verb_ratio(words),
-            "diminutive_noun_count": self._count_diminutives(words),
+            "verb_perfective_ratio": round(perfective_count / verb_count, 3) if verb_count else 0.0,
+            "diminutive_noun_count": diminutive_count,
             "dialogue_markers": self._count_dialogue_markers(text),
 
             # Общие
             "total_words": total,
-            "unique_lemmas": len({self.morph.parse(w)[0].normal_form
-                                  for w in words if self.morph.parse(w)}),
+            "unique_lemmas": len(lemmas),
         }
 
-    def _compute_perfective_verb_ratio(self, words: List[str]) -> float:
-        """Доля глаголов совершенного вида — важна для динамики (сказки: высокая)."""
-        perfective_count = 0
-        verb_count = 0
-        for w in words:
-            parses = self.morph.parse(w)
-            if parses:
-                tag = parses[0].tag
-                if tag.POS in ("VERB", "INFN"):
-                    verb_count += 1
-                    if "perf" in tag.aspect:
-                        perfective_count += 1
-        return round(perfective_count / verb_count, 3) if verb_count else 0.0
-
-    def _count_diminutives(self, words: List[str]) -> int:
-        """Считает уменьшительно-ласкательные существительные (сказки: много!)."""
-        suffixes = ("очк", "еньк", "оньк", "еньк", "ушк", "ышк", "ичк", "ичк")
-        count = 0
-        for w in words:
-            norm = self.morph.parse(w)[0].normal_form if self.morph.parse(w) else w
-            if any(norm.endswith(s) for s in suffixes):
-                count += 1
-        return count
-
     def _count_dialogue_markers(self, text: str) -> int:
         """Кавычки-«ёлочки», тире в начале строки — признак диалога (сказки: часто)."""
         count = 0
-        count += len(re.findall(r'«[^»]*»', text))  # «речь»
-        count += len(re.findall(r'^\s*—', text, re.MULTILINE))  # — сказал он
+        # Проверка `in` почти бесплатна и избавляет от прохода регуляркой по тексту без диалогов
+        if '«' in text:
+            count += len(_QUOTE_RE.findall(text))  # «речь»
+        if '—' in text:
+            count += len(_DASH_LINE_RE.findall(text))  # — сказал он
         return count
 
     @staticmethod
@@ -0,0 +1,70 @@
+import functools
+from typing import Dict, Union
+
+from core.analyze._tokenize import TokenizedText, tokenize
+
+try:
+    # Необязательное C-расширение: python setup.py build_ext --inplace
+    from core.analyze import _textscan as _textscan_ext
+except ImportError:
+    _textscan_ext = None
+
+# Порядок ключей совпадает с порядком счётчиков, которые возвращает _textscan.scan
+_STATS_KEYS = (
+    "n_words", "n_sentences", "n_syllables", "n_poly3", "n_poly4", "n_long_words", "n_long_sentences",
+)
+
+# Разбор последних текстов переиспользуется анализаторами, которым текст передан строкой;
+# длинные тексты не кэшируются, чтобы не держать в памяти большие строки и их токены
+_TOKENIZED_CACHE_SIZE = 32
+_TOKENIZED_CACHE_MAX_LEN = 200_000
+
+
+@functools.lru_cache(maxsize=_TOKENIZED_CACHE_SIZE)
+def _tokenize_cached(text: str) -> TokenizedText:
+    return tokenize(text)
+
+
+class _BaseTextStats:
+    """
+    Общая основа анализаторов текста (сложность, дескриптивные метрики, удобочитаемость).
+    Если один и тот же текст передаётся строкой в compute нескольких анализаторов подряд,
+    он токенизируется один раз: второй и следующие получают тот же TokenizedText из кэша.
+    Ключ кэша — сама строка, поэтому совпадение хэшей не приводит к чужому результату.
+    """
+
+    @staticmethod
+    def _tokenized(text: str) -> TokenizedText:
+        if len(text) > _TOKENIZED_CACHE_MAX_LEN:
+            return tokenize(text)
+        return _tokenize_cached(text)
+
+
+def compute_stats(text: Union[str, TokenizedText]) -> Dict[str, int]:
+    """
+    Базовые счётчики текста, на которых строятся все индексы удобочитаемости.
+    Считаются за один проход по уже токенизированным словам (массивы NumPy), формулы
+    индексов дальше — только арифметика над этими числами:
+      • n_words, n_sentences, n_syllables;
+      • n_poly3 / n_poly4 — слова с ≥3 / ≥4 слогами;
+      • n_long_words — слова с ≥7 буквами;
+      • n_long_sentences — предложения длиннее 15 слов.
+    """
+    tok = text if isinstance(text, TokenizedText) else tokenize(text)
+    # Слова и слоги ещё не выделены — C-расширение считает всё одним проходом по тексту,
+    # иначе дешевле досчитать по уже готовым массивам
+    if _textscan_ext is not None and 'syllables' not in tok.__dict__:
+        return dict(zip(_STATS_KEYS, _textscan_ext.scan(tok.text_lower)))
+    # words_per_sentence заполняет и words тем же проходом регулярки
+    words_per_sentence = tok.words_per_sentence
+    syllables = tok.syllables
+    lengths = tok.word_lengths
+    return {
+        "n_words": tok.n_words,
+        "n_sentences": tok.n_sentences,
+        "n_syllables": int(syllables.sum()),
+        "n_poly3": int((syllables >= 3).sum()),
+        "n_poly4": int((syllables >= 4).sum()),
+        "n_long_words": int((lengths >= 7).sum()),
+        "n_long_sentences": sum(n > 15 for n in words_per_sentence),
+    }
@@ -1,68 +1,50 @@
 # src/data/complexity_metrics.py
-import re
-from typing import Dict, List
+from typing import Dict, Union
 
+from core.analyze._tokenize import TokenizedText, count_syllables_ru, split_sentences, split_words
+from core.analyze.stats import _BaseTextStats
 
-class TextComplexityMetrics:
+
+class TextComplexityMetrics(_BaseTextStats):
     """
     Вычисляет базовые метрики сложности текста на русском (и частично — на других языках).
     Поддерживает гипотезы: короткие предложения + короткие слова → проще текст.
     """
 
-    @staticmethod
-    def _split_sentences(text: str) -> List[str]:
-        """Разделяет текст на предложения (учитывает ..., !?, и т.д.)."""
-        # Простой, но robust-подход для русского: точки, восклицания, вопросы — с последующими заглавными
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
-
-    @staticmethod
-    def _split_words(sentence: str) -> List[str]:
-        """Извлекает слова (только буквы и дефисы внутри слов)."""
-        return re.findall(r'\b[а-яА-ЯёЁa-zA-Z]+(?:-[а-яА-ЯёЁa-zA-Z]+)*\b', sentence)
+    _split_sentences = staticmethod(split_sentences)
+    _split_words = staticmethod(split_words)
+    _count_syllables_ru = staticmethod(count_syllables_ru)
 
-    @staticmethod
-    def _count_syllables_ru(word: str) -> int:
-        """
-        Подсчёт слогов в русском слове по гласным (е, ё, и, о, у, ы, э, ю, я, а).
-        Простая, но эффективная эвристика — подходит для оценки сложности.
-        """
-        word = word.lower()
-        vowels = "аеёиоуыэюя"
-        return max(1, sum(1 for char in word if char in vowels))
-
-    def compute(self, text: str) -> Dict[str, float]:
+    def compute(self, text: Union[str, TokenizedText]) -> Dict[str, float]:
         """
         Возвращает словарь с метриками.
         Все значения округлены до 2 знаков для воспроизводимости и логгирования.
+        Вместо строки можно передать общий AnalysisContext (core.analyze.context).
         """
-        if not isinstance(text, str) or not text.strip():
-            return {
-                "avg_sentence_length": 0.0,
-                "avg_word_syllables": 0.0,
-                "avg_word_letters": 0.0,
-                # доп. метрики для анализа
-                "sentence_count": 0,
-                "word_count": 0,
-                "char_count": len(text),
-                "confidence_hint": 0.0,
-            }
+        if isinstance(text, TokenizedText):
+            return self.from_tok(text)
+        if not isinstance(text, str):
+            return self._empty_result(text)
+        return self.from_tok(self._tokenized(text))
+
+    def from_tok(self, tok: TokenizedText) -> Dict[str, float]:
+        """То же, что compute, но по уже токенизированному тексту (см. core.analyze._tokenize.tokenize)."""
+        text = tok.text
+        if tok.is_blank:
+            return self._empty_result(text)
 
-        sentences = self._split_sentences(text)
-        words = []
-        for sent in sentences:
-            words.extend(self._split_words(sent))
+        sentences = tok.sentences
+        words = tok.sentence_words
 
         # 1. Средняя длина предложения (в словах)
         avg_sent_len = len(words) / len(sentences) if sentences else 0
 
         # 2. Средняя длина слова в слогах
-        syllables = [self._count_syllables_ru(w) for w in words]
-        avg_syllables = sum(syllables) / len(syllables) if syllables else 0
+        syllables = tok.sentence_word_syllables
+        avg_syllables = int(syllables.sum()) / len(syllables) if len(syllables) else 0
 
         # 3. Средняя длина слова в буквах
-        letters = [len(w) for w in words]
-        avg_letters = sum(letters) / len(letters) if letters else 0
+        avg_letters = sum(map(len, words)) / len(words) if words else 0
 
         # Confidence: если мало предложений/слов — низкая уверенность
         confidence = 1.0
@@ -82,4 +64,17 @@ class TextComplexityMetrics:
             "word_count": len(words),
             "char_count": len(text),
             "confidence_hint": round(confidence, 2),
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def _empty_result(text) -> Dict[str, float]:
+        return {
+            "avg_sentence_length": 0.0,
+            "avg_word_syllables": 0.0,
+            "avg_word_letters": 0.0,
+            # доп. метрики для анализа
+            "sentence_count": 0,
+            "word_count": 0,
+            "char_count": len(text),
+            "confidence_hint": 0.0,
+        }
@@ -5,29 +5,39 @@ from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Всё, кроме букв, цифр и пунктуации, включая пробельные символы; серия таких символов → один пробел
+_CLEAN_RE = re.compile(r'[^\w\-.,!?;:\"\']+')
+# Непустое предложение: от первого непробельного символа до ближайшего разделителя [.!?]
+_SENT_BODY_RE = re.compile(r'[^.!?\s][^.!?]*')
+
+# Ключи признаков в результате preprocess_example — в том же порядке, что и в compute_text_features
+_FEAT_KEYS = tuple(f"feat_{k}" for k in (
+    "char_count", "word_count", "sentence_count", "avg_word_len",
+    "has_quotes", "is_too_short", "is_too_long",
+))
+
 
 def clean_text(text: str) -> str:
     """Универсальная очистка: пробелы, спецсимволы, повторы."""
     if not isinstance(text, str):
         return ""
-    text = re.sub(r'\s+', ' ', text)  # лишние пробелы → один
-    text = re.sub(r'[^\w\s\-.,!?;:\"\']', ' ', text)  # оставить только буквы, цифры, пунктуацию
-    text = text.strip()
-    return text
+    # Один проход: спецсимволы и лишние пробелы → один пробел, остаются буквы, цифры, пунктуация
+    return _CLEAN_RE.sub(' ', text).strip()
 
 
 def compute_text_features(text: str) -> Dict[str, float]:
     """Извлекает признаки для confidence-оценки и анализа."""
     words = text.split()
-    sentences = re.split(r'[.!?]+', text)
+    n_words = len(words)
+    total_letters = sum(map(len, words))  # map(len) и sum работают на уровне C, без генератора
     return {
         "char_count": len(text),
-        "word_count": len(words),
-        "sentence_count": len([s for s in sentences if s.strip()]),
-        "avg_word_len": sum(len(w) for w in words) / len(words) if words else 0,
+        "word_count": n_words,
+        "sentence_count": len(_SENT_BODY_RE.findall(text)),
+        "avg_word_len": total_letters / n_words if n_words else 0,
         "has_quotes": int('"' in text or "'" in text),
-        "is_too_short": int(len(words) < 3),
-        "is_too_long": int(len(words) > 512),  # порог для BERT
+        "is_too_short": int(n_words < 3),
+        "is_too_long": int(n_words > 512),  # порог для BERT
     }
 
 
@@ -55,7 +65,7 @@ def preprocess_example(example: Dict, text_field: str = "text") -> Dict:
     return {
         **example,
         "text_clean": cleaned,
-        **{f"feat_{k}": v for k, v in features.items()},
+        **dict(zip(_FEAT_KEYS, features.values())),
         "confidence_hint": confidence_hint,
         "is_valid_for_training": filter_by_quality(features),
     }
\ No newline at end of file
@@ -1,12 +1,12 @@
-from core.analyze.textComplexityMetrics import TextComplexityMetrics
-from core.analyze.descriptiveTextMetrics import DescriptiveTextMetrics
-from core.analyze.morpho_metrics import MorphoMetrics
-from core.analyze.ReadabilityIndexCalculator import ReadabilityIndexCalculator
+import argparse
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-metrics = TextComplexityMetrics()
-metrics2 = DescriptiveTextMetrics()
+# Порядок анализаторов задаёт и порядок блоков в отчёте
+_ANALYZERS = ("complexity", "descriptive", "morpho", "readability")
 
-text = """# Базы данных: от реляционных корней к распределённым облакам  
+SAMPLE_TEXT = """# Базы данных: от реляционных корней к распределённым облакам  
 *Полный технический обзор, 2025 г.*
 
 ## 1. Введение: что такое база данных?
@@ -131,28 +131,101 @@ text = """# Базы данных: от реляционных корней к 
 
 → Запрос: `SELECT * FROM items ORDER BY embedding <-> ? LIMIT 10`.
 6"""
-result = metrics.compute(text)
-result2 = metrics2.compute(text)
-print(result)
-print(result2)
-mm = MorphoMetrics()
-res = mm.compute(text)
-
-calc = ReadabilityIndexCalculator()
-res2 = calc.compute(text)
-
-print(f"Существительных (NOUN):       {res['nouns']}")
-print(f"Глаголов (VERB + INFN):      {res['verbs']}")
-print(f"Прилагательных (ADJF):       {res['adjectives']}")
-print(f"Местоимений (NPRO и др.):    {res['pronouns']}")
-print(f"Наречий (ADVB):              {res['adverbs']}")
-print(f"Предлогов (PREP):            {res['prepositions']}")
-print(f"Союзов (CONJ):               {res['conjunctions']}")
-print(f"Частиц (PRCL):               {res['particles']}")
-print(f"Междометий (INTJ):           {res['interjections']}")
-print()
-print(f"Всего слов:                  {res['total_words']}")
-print()
-print(f"Flesch: {res2['flesch_reading_ease']} - {res2['flesch_level']}")
-print(f"SMOG:   {res2['smog_grade']} класс")
-print(f"«Просто о сложном»: {res2['simple_level']}/5")
+
+
+def _load_analyzer(name: str):
+    """
+    Импортирует модуль анализатора и создаёт его экземпляр.
+    Импорты внутри функции: модули (и словари pymorphy3) грузятся, только если метрики нужны.
+    """
+    if name == "complexity":
+        from core.analyze.textComplexityMetrics import TextComplexityMetrics
+        return TextComplexityMetrics()
+    if name == "descriptive":
+        from core.analyze.descriptiveTextMetrics import DescriptiveTextMetrics
+        return DescriptiveTextMetrics()
+    if name == "morpho":
+        from core.analyze.morpho_metrics import MorphoMetrics
+        return MorphoMetrics()
+    if name == "readability":
+        from core.analyze.ReadabilityIndexCalculator import ReadabilityIndexCalculator
+        return ReadabilityIndexCalculator()
+    raise ValueError(f"Неизвестный анализатор: {name}")
+
+
+def _format_report(results: dict) -> str:
+    lines = []
+    if "complexity" in results:
+        lines.append(str(results["complexity"]))
+    if "descriptive" in results:
+        lines.append(str(results["descriptive"]))
+    if "morpho" in results:
+        res = results["morpho"]
+        lines += [
+            f"Существительных (NOUN):       {res['nouns']}",
+            f"Глаголов (VERB + INFN):      {res['verbs']}",
+            f"Прилагательных (ADJF):       {res['adjectives']}",
+            f"Местоимений (NPRO и др.):    {res['pronouns']}",
+            f"Наречий (ADVB):              {res['adverbs']}",
+            f"Предлогов (PREP):            {res['prepositions']}",
+            f"Союзов (CONJ):               {res['conjunctions']}",
+            f"Частиц (PRCL):               {res['particles']}",
+            f"Междометий (INTJ):           {res['interjections']}",
+            "",
+            f"Всего слов:                  {res['total_words']}",
+        ]
+    if "readability" in results:
+        res2 = results["readability"]
+        if "morpho" in results:
+            lines.append("")
+        lines += [
+            f"Flesch: {res2['flesch_reading_ease']} - {res2['flesch_level']}",
+            f"SMOG:   {res2['smog_grade']} класс",
+            f"«Просто о сложном»: {res2['simple_level']}/5",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Метрики сложности русского текста.")
+    parser.add_argument(
+        "path", nargs="?",
+        help="файл с текстом ('-' — stdin); без аргумента анализируется встроенный пример",
+    )
+    parser.add_argument(
+        "--only", action="append", choices=_ANALYZERS,
+        help="считать только указанные метрики (можно указать несколько раз)",
+    )
+    args = parser.parse_args(argv)
+    names = [name for name in _ANALYZERS if not args.only or name in args.only]
+
+    if "morpho" in names:
+        # Словари pymorphy3 грузятся в фоне, пока читается текст и создаются остальные анализаторы
+        from core.analyze._morph import get_morph
+        threading.Thread(target=get_morph, daemon=True).start()
+
+    if args.path is None:
+        text = SAMPLE_TEXT
+    elif args.path == "-":
+        text = sys.stdin.read()
+    else:
+        with open(args.path, encoding="utf-8") as f:
+            text = f.read()
+
+    from core.analyze.context import AnalysisContext
+
+    # MorphAnalyzer создаётся в конструкторе — до запуска потоков, без гонки при первой инициализации
+    analyzers = {name: _load_analyzer(name) for name in names}
+
+    # Текст разбирается один раз, общий контекст передаётся во все анализаторы;
+    # анализаторы независимы, поэтому считаются параллельно в пуле потоков
+    ctx = AnalysisContext(text)
+    with ThreadPoolExecutor(max_workers=len(analyzers)) as executor:
+        futures = {name: executor.submit(analyzer.compute, ctx) for name, analyzer in analyzers.items()}
+        results = {name: f.result() for name, f in futures.items()}
+    # Весь отчёт собирается в одну строку и выводится одной записью в stdout
+    sys.stdout.write(_format_report(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Сборка необязательных C-расширений (Cython):
+
+    python setup.py build_ext --inplace
+
+Без них код работает на чистом Python/NumPy: если Cython не установлен или
+компиляция не удалась, пакет ставится без расширений.
+"""
+from setuptools import Extension, find_namespace_packages, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+# optional=True: ошибка компилятора не прерывает установку, а только пропускает расширение
+extensions = [
+    Extension("core.analyze._syllables", ["core/analyze/_syllables.pyx"], optional=True),
+    Extension("core.analyze._textscan", ["core/analyze/_textscan.pyx"], optional=True),
+]
+
+setup(
+    name="bert-text-complexity",
+    packages=find_namespace_packages(include=["core", "core.*"]),
+    install_requires=["numpy", "pymorphy3"],
+    # C-реализация DAWG для словарей pymorphy3: разбор в разы быстрее, чем на DAWG-Python
+    extras_require={"fast": ["DAWG2>=0.13"]},
+    # .pyx без Cython не собрать, а сгенерированные .c в репозиторий не входят
+    ext_modules=cythonize(extensions, language_level=3) if cythonize is not None else [],
+)
@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from core.analyze._tokenize import _TRANSLATE_MIN_LEN
+
+# Кириллица обоих регистров, латиница, цифры, «_», дефисы, знаки конца предложения,
+# пробелы и символы вне cp1251 (ӿ, é, эмодзи)
+_ALPHABET = (
+    "абвгдеёжзийклмнопрстуфхцчшщъыьэюя" "АБВЕЁИОУЫЭЮЯ" "abcXYZ" "0159_" "---" ".!?,;:«»—"
+    "     \n\t" "ӿé\U0001F600"
+)
+_WORDS = ("мама", "пре-красно", "ёж", "Переподготовка", "аудитория", "x-мама", "мама-x", "abc", "5мама")
+
+
+def _random_texts(n: int, seed: int, max_len: int):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        length = rng.randint(0, max_len)
+        if rng.random() < 0.5:
+            texts.append("".join(rng.choice(_ALPHABET) for _ in range(length)))
+        else:
+            parts = [rng.choice(_WORDS) + rng.choice(" .!?,-\n") for _ in range(length // 6)]
+            texts.append(" ".join(parts))
+    return texts
+
+
+@pytest.fixture(scope="session")
+def random_texts():
+    """Случайные тексты (в том числе длиннее _TRANSLATE_MIN_LEN) и крайние случаи для проверки быстрых путей."""
+    return _random_texts(300, seed=0, max_len=3 * _TRANSLATE_MIN_LEN) + [
+        "",
+        "   ",
+        "-мама-",
+        "мама--папа",
+        "Мама мыла раму. " * 100,
+        "ёлка-палка " * 100,
+    ]
@@ -0,0 +1,32 @@
+import pytest
+
+from core.analyze.analyzer import Analyzer
+
+_TEXTS = [
+    "",
+    "   ",
+    "Мама мыла раму.",
+    "«Кто там?» — спросила бабушка. — Это я, внученька!\nЖили-были дед да баба. Ok, 2PC.",
+]
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return Analyzer()
+
+
+@pytest.mark.parametrize("text", _TEXTS)
+def test_analyze_matches_individual_analyzers(analyzer, text):
+    result = analyzer.analyze(text)
+    assert result == {
+        "complexity": analyzer.complexity.compute(text),
+        "descriptive": analyzer.descriptive.compute(text),
+        "morpho": analyzer.morpho.compute(text),
+        "readability": analyzer.readability.compute(text),
+    }
+
+
+@pytest.mark.parametrize("value", [None, 123, b"abc", ["x"]])
+def test_analyze_rejects_non_str(analyzer, value):
+    with pytest.raises(TypeError):
+        analyzer.analyze(value)
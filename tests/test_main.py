@@ -0,0 +1,55 @@
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import main
+from core.analyze.ReadabilityIndexCalculator import ReadabilityIndexCalculator
+from core.analyze.descriptiveTextMetrics import DescriptiveTextMetrics
+from core.analyze.textComplexityMetrics import TextComplexityMetrics
+
+_ROOT = Path(__file__).resolve().parent.parent
+_TEXT = "Мама мыла раму. Папа читал газету.\n"
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_text(_TEXT, encoding="utf-8")
+    return str(path)
+
+
+def test_only_complexity_from_file(capsys, text_file):
+    main.main(["--only", "complexity", text_file])
+    assert capsys.readouterr().out == f"{TextComplexityMetrics().compute(_TEXT)}\n"
+
+
+def test_stdin_and_report_order(capsys, monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(_TEXT))
+    main.main(["--only", "readability", "--only", "descriptive", "-"])
+    readability = ReadabilityIndexCalculator().compute(_TEXT)
+    assert capsys.readouterr().out == (
+        f"{DescriptiveTextMetrics().compute(_TEXT)}\n"
+        f"Flesch: {readability['flesch_reading_ease']} - {readability['flesch_level']}\n"
+        f"SMOG:   {readability['smog_grade']} класс\n"
+        f"«Просто о сложном»: {readability['simple_level']}/5\n"
+    )
+
+
+def test_unknown_analyzer_is_rejected(capsys):
+    with pytest.raises(SystemExit):
+        main.main(["--only", "syntax"])
+
+
+def test_morphology_is_not_imported_when_not_requested(text_file):
+    # Отдельный процесс: в текущем модули морфологии уже могли быть импортированы другими тестами
+    code = (
+        "import sys, main; main.main(['--only', 'readability', sys.argv[1]]); "
+        "print('core.analyze.morpho_metrics' in sys.modules, 'pymorphy3' in sys.modules, file=sys.stderr)"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code, text_file], cwd=_ROOT, capture_output=True, text=True, check=True
+    )
+    assert proc.stderr.strip().splitlines()[-1] == "False False"
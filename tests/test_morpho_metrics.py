@@ -0,0 +1,106 @@
+from collections import Counter
+
+import pytest
+
+from core.analyze._morph import get_morph
+from core.analyze._tokenize import tokenize
+from core.analyze.context import AnalysisContext
+from core.analyze import morpho_metrics
+from core.analyze.morpho_metrics import _POS_IDX, _POS_OTHER, MorphoMetrics
+
+_TEXTS = [
+    "",
+    "Ok, 2PC.",
+    "Жили-были дед да баба. Была у них курочка Ряба.",
+    "«Кто там?» — спросила бабушка.\n— Это я, внученька, Красная Шапочка! Я принесла пирожок и горшочек масла.",
+    "Он быстро прочитал книжечку, потом читал газету и решил сходить в лес за грибочками.",
+    "Мама мыла раму. Мама мыла раму. Сыночек спал в кроватке.",
+]
+_DIM_SUFFIXES = ("очк", "еньк", "оньк", "ушк", "ышк", "ичк")
+
+
+def _reference(text: str) -> dict:
+    """Прямой разбор каждого слова pymorphy3 без кэшей и таблиц — как считал исходный MorphoMetrics."""
+    morph = get_morph()
+    words = MorphoMetrics._extract_words_lower(text.lower())
+    parses = [(morph.parse(w) or [None])[0] for w in words]
+    pos = Counter((p.tag.POS if p is not None else None) or "UNKNOWN" for p in parses)
+    verbs = [p for p in parses if p is not None and p.tag.POS in ("VERB", "INFN")]
+    perfective = sum(p.tag.aspect == "perf" for p in verbs)
+    diminutive = sum(
+        (p.normal_form if p is not None else w).endswith(_DIM_SUFFIXES) for w, p in zip(words, parses)
+    )
+    return {
+        "pos": pos,
+        "total_words": len(words),
+        "verb_perfective_ratio": round(perfective / len(verbs), 3) if verbs else 0.0,
+        "diminutive_noun_count": diminutive,
+        "unique_lemmas": len({p.normal_form for p in parses if p is not None}),
+    }
+
+
+@pytest.fixture(scope="module")
+def morpho():
+    return MorphoMetrics()
+
+
+@pytest.mark.parametrize("text", _TEXTS)
+def test_compute_matches_direct_parsing(morpho, text):
+    result = morpho.compute(text)
+    expected = _reference(text)
+    if not expected["total_words"]:
+        assert result == MorphoMetrics._empty_result()
+        return
+    for key in ("total_words", "verb_perfective_ratio", "diminutive_noun_count", "unique_lemmas"):
+        assert result[key] == expected[key], key
+    assert result["verbs"] == expected["pos"]["VERB"]
+
+
+@pytest.mark.parametrize("text", _TEXTS)
+def test_compute_accepts_tokenized_text(morpho, text):
+    assert morpho.compute(tokenize(text)) == morpho.compute(text) == morpho.compute(AnalysisContext(text))
+
+
+def test_pos_index_table():
+    assert sorted(_POS_IDX.values()) == list(range(_POS_OTHER))
+
+
+@pytest.mark.parametrize("text", _TEXTS)
+def test_pos_tally_matches_counter(morpho, text):
+    result = morpho.compute(text)
+    pos = _reference(text)["pos"]
+    if not sum(pos.values()):
+        return
+    assert result["nouns"] == pos["NOUN"]
+    assert result["verbs"] == pos["VERB"]
+    assert result["adjectives"] == pos["ADJF"]
+    assert result["pronouns"] == pos["NPRO"] + pos["ADJPRO"] + pos["PRTFPRO"]
+    assert result["adverbs"] == pos["ADVB"]
+    assert result["prepositions"] == pos["PREP"]
+    assert result["conjunctions"] == pos["CONJ"]
+    assert result["particles"] == pos["PRCL"]
+    assert result["interjections"] == pos["INTJ"]
+    total = result["total_words"]
+    assert result["noun_ratio"] == round(pos["NOUN"] / total, 3)
+    assert result["verb_ratio"] == round(pos["VERB"] / total, 3)
+    assert result["adj_ratio"] == round(pos["ADJF"] / total, 3)
+
+
+def test_word_features_from_best_parse():
+    morph = get_morph()
+    for word in ("прочитал", "читал", "книжечку", "бабушка", "в", "ааааыыы"):
+        parse = morph.parse(word)[0]
+        pos_id, lemma, is_verb, is_perf, is_dim = morpho_metrics._word_features(word)
+        assert pos_id == _POS_IDX.get(parse.tag.POS, _POS_OTHER)
+        assert lemma == parse.normal_form
+        assert is_verb == (parse.tag.POS in ("VERB", "INFN"))
+        assert is_perf == (is_verb and parse.tag.aspect == "perf")
+        assert is_dim == parse.normal_form.endswith(_DIM_SUFFIXES)
+
+
+def test_compute_does_not_depend_on_cache_state(morpho):
+    text = _TEXTS[3]
+    warm = morpho.compute(text)
+    morpho_metrics._word_features.cache_clear()
+    assert morpho.compute(text) == warm
+    assert morpho_metrics._word_features.cache_info().hits > 0  # повторы слов в тексте
@@ -0,0 +1,62 @@
+import pickle
+
+import pytest
+
+from core.analyze import _pos_cache
+from core.analyze._pos_cache import PersistentCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(_pos_cache._ENV_CACHE_DIR, str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def _no_atexit(monkeypatch):
+    # save вызывается в тестах явно; регистрация в atexit писала бы во временные каталоги после тестов
+    monkeypatch.setattr(_pos_cache.atexit, "register", lambda func: func)
+
+
+@pytest.mark.parametrize("value", [None, ""])
+def test_disabled_without_cache_dir(monkeypatch, tmp_path, value):
+    if value is None:
+        monkeypatch.delenv(_pos_cache._ENV_CACHE_DIR, raising=False)
+    else:
+        monkeypatch.setenv(_pos_cache._ENV_CACHE_DIR, value)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache = PersistentCache("test", version=1)
+    cache.set("мама", (1, 2))
+    assert cache.path is None
+    assert cache.get("мама") is None
+    cache.save()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_roundtrip(cache_dir):
+    cache = PersistentCache("test", version=1)
+    assert cache.get("мама") is None
+    cache.set("мама", (0, "мама", False, False, False))
+    cache.save()
+    assert (cache_dir / "test.pickle").exists()
+
+    reloaded = PersistentCache("test", version=1)
+    assert reloaded.get("мама") == (0, "мама", False, False, False)
+
+
+def test_version_change_invalidates(cache_dir):
+    cache = PersistentCache("test", version=1)
+    cache.set("мама", 1)
+    cache.save()
+    assert PersistentCache("test", version=2).get("мама") is None
+
+
+def test_corrupt_file_gives_empty_cache(cache_dir):
+    (cache_dir / "test.pickle").write_bytes(b"not a pickle")
+    cache = PersistentCache("test", version=1)
+    assert cache.get("мама") is None
+    cache.set("мама", 1)
+    cache.save()
+    with open(cache_dir / "test.pickle", "rb") as f:
+        header, data = pickle.load(f)
+    assert data == {"мама": 1}
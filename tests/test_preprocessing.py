@@ -0,0 +1,41 @@
+import re
+
+import pytest
+
+from core.data.preprocessing import clean_text
+
+_OLD_WS_RE = re.compile(r'\s+')
+_OLD_PUNCT_RE = re.compile(r'[^\w\s\-.,!?;:\"\']')
+
+
+def _clean_text_two_pass(text: str) -> str:
+    """Прежняя очистка в два прохода: пробелы → один, затем спецсимволы → пробел."""
+    return _OLD_PUNCT_RE.sub(' ', _OLD_WS_RE.sub(' ', text)).strip()
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "   ",
+    "Мама мыла раму.",
+    "a @ b",
+    "  «Кто там?» —\tспросила\n\nбабушка…  ",
+    "e-mail: test@example.com; цена 5$ (со скидкой)!",
+    "@#$%",
+    "под_чёркивание и 'кавычки' \"двойные\"",
+])
+def test_clean_text_single_pass(text):
+    cleaned = clean_text(text)
+    # Те же токены, что и раньше; отличие только в том, что серии пробелов схлопываются в один
+    assert cleaned == " ".join(_clean_text_two_pass(text).split())
+    assert "  " not in cleaned
+    assert cleaned == cleaned.strip()
+
+
+def test_clean_text_examples():
+    assert clean_text("a @ b") == "a b"
+    assert clean_text("  Привет,\t\tмир!!  ") == "Привет, мир!!"
+
+
+@pytest.mark.parametrize("value", [None, 123, b"abc"])
+def test_clean_text_non_str(value):
+    assert clean_text(value) == ""
@@ -0,0 +1,66 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.analyze.ReadabilityIndexCalculator import ReadabilityIndexCalculator
+
+
+_WORDS = ("мама", "мыла", "раму", "переподготовка", "ёж", "и", "в", "пре-красно", "abc", "5", "—", "«", "»")
+_PUNCT = (".", "!", "?", ",", "")
+
+
+def _random_texts(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        parts = []
+        for _ in range(rng.randint(0, 40)):
+            parts.append(rng.choice(_WORDS) + rng.choice(_PUNCT))
+        texts.append(" ".join(parts))
+    return texts
+
+
+def _sentences(n_words: int, n_sentences: int, word: str = "мама") -> str:
+    """Текст из n_words слов, разбитых на n_sentences предложений."""
+    sizes = [n_words // n_sentences] * n_sentences
+    for i in range(n_words % n_sentences):
+        sizes[i] += 1
+    return " ".join(" ".join([word] * size) + "." for size in sizes)
+
+
+# Средние, попадающие ровно на границу округления (…5)
+_TIE_TEXTS = [
+    _sentences(69, 40),  # avg_sentence_words = 1.725
+    _sentences(29, 8),  # 3.625
+    _sentences(45, 8, "переподготовка"),
+    _sentences(21, 8, "раму"),
+]
+
+_EDGE_TEXTS = ["", "   ", ".", "- .", "abc def.", "Мама!\x00папа", "5мама. ок"]
+
+
+def _as_python(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_compute_batch_matches_compute(seed):
+    calc = ReadabilityIndexCalculator()
+    texts = _TIE_TEXTS + _EDGE_TEXTS + _random_texts(200, seed)
+    batch = calc.compute_batch(texts)
+    for i, text in enumerate(texts):
+        expected = calc.compute(text)
+        assert set(batch) == set(expected)
+        for key, value in expected.items():
+            assert _as_python(batch[key][i]) == value, (text, key)
+
+
+def test_compute_batch_rounds_ties_like_round():
+    batch = ReadabilityIndexCalculator().compute_batch([_sentences(69, 40)])
+    assert batch["avg_sentence_words"][0] == round(69 / 40, 2)
+
+
+def test_compute_batch_empty():
+    batch = ReadabilityIndexCalculator().compute_batch([])
+    assert all(len(v) == 0 for v in batch.values())
@@ -0,0 +1,22 @@
+from core.analyze import ReadabilityIndexCalculator as readability
+from core.analyze.ReadabilityIndexCalculator import ReadabilityIndexCalculator
+
+
+def test_repeated_compute_returns_equal_independent_dict():
+    calc = ReadabilityIndexCalculator()
+    text = "Мама мыла раму. Папа читал газету."
+    first = calc.compute(text)
+    first["flesch_reading_ease"] = -1.0
+    second = calc.compute(text)
+    assert second == calc.from_tok(calc._tokenized(text))
+    assert second is not first
+    assert second["flesch_reading_ease"] != -1.0
+    assert calc._compute_cached.cache_info().hits == 1
+
+
+def test_long_texts_are_not_cached():
+    calc = ReadabilityIndexCalculator()
+    text = "Мама мыла раму. " * (readability._RESULT_CACHE_MAX_LEN // 16 + 1)
+    assert len(text) > readability._RESULT_CACHE_MAX_LEN
+    assert calc.compute(text) == calc.compute(text)
+    assert calc._compute_cached.cache_info().currsize == 0
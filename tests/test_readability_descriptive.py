@@ -0,0 +1,20 @@
+import pytest
+
+from core.analyze import ReadabilityIndexCalculator as readability
+from core.analyze.descriptiveTextMetrics import DescriptiveTextMetrics
+
+_TEXT = "Мама мыла раму. Мама пела."
+
+
+@pytest.mark.parametrize(
+    "metrics", [readability.DescriptiveTextMetrics(), readability.ReadabilityIndexCalculator().descriptive]
+)
+@pytest.mark.parametrize("text", [_TEXT, "", None])
+def test_legacy_unique_words_key(metrics, text):
+    result = metrics.compute(text)
+    assert "Уникальные слова (unique_words)" not in result
+    assert list(result)[1] == "unique_words"
+    if text:
+        shared = DescriptiveTextMetrics().compute(text)
+        assert result["unique_words"] == shared["Уникальные слова (unique_words)"] == 4
+        assert list(result.values()) == list(shared.values())
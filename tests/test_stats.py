@@ -0,0 +1,22 @@
+import pytest
+
+from core.analyze import stats
+from core.analyze._tokenize import tokenize
+from core.analyze.stats import compute_stats
+
+
+def test_textscan_matches_python(monkeypatch, random_texts):
+    ext = pytest.importorskip("core.analyze._textscan")
+    for text in random_texts:
+        monkeypatch.setattr(stats, "_textscan_ext", ext)
+        fast = compute_stats(tokenize(text))
+        monkeypatch.setattr(stats, "_textscan_ext", None)
+        assert fast == compute_stats(tokenize(text)), text
+
+
+def test_compute_stats_uses_ready_syllables(random_texts):
+    # Если слоги уже посчитаны, compute_stats досчитывает по массивам TokenizedText — итог тот же
+    for text in random_texts[:50]:
+        tok = tokenize(text)
+        tok.syllables
+        assert compute_stats(tok) == compute_stats(tokenize(text)), text
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from core.analyze import _tokenize
+from core.analyze._tokenize import (
+    _SYLLABLES_VECTOR_MIN_WORDS,
+    _WORD_RE_RUCYR,
+    count_syllables_ru,
+    syllables_per_word,
+)
+
+_WORDS = ["мама", "", "пре-красно", "ӿ", "аудитория", "МАМА", "ёж", "abc", "переподготовка"]
+
+
+@pytest.mark.parametrize(
+    "n", [1, _SYLLABLES_VECTOR_MIN_WORDS - 1, _SYLLABLES_VECTOR_MIN_WORDS, 4 * _SYLLABLES_VECTOR_MIN_WORDS]
+)
+def test_syllables_per_word_matches_count_syllables(monkeypatch, n):
+    # Оба пути без C-расширения: по словам (короткие списки) и векторный
+    monkeypatch.setattr(_tokenize, "_syllables_ext", None)
+    words = (_WORDS * n)[:n]
+    counts = syllables_per_word(words)
+    assert counts.dtype == syllables_per_word(_WORDS * 10).dtype
+    assert counts.tolist() == [count_syllables_ru(w) for w in words]
+
+
+def test_syllables_per_word_empty():
+    assert syllables_per_word([]).tolist() == []
+
+
+def test_syllables_ext_matches_python(monkeypatch, random_texts):
+    ext = pytest.importorskip("core.analyze._syllables")
+    words = [w for t in random_texts for w in _WORD_RE_RUCYR.findall(t.lower())]
+    words += ["", "МАМА", "ӿ", "\U0001F600а", "a"]
+    monkeypatch.setattr(_tokenize, "_syllables_ext", ext)
+    fast_counts = [count_syllables_ru(w) for w in words]
+    fast_array = syllables_per_word(words)
+    monkeypatch.setattr(_tokenize, "_syllables_ext", None)
+    assert fast_counts == [count_syllables_ru(w) for w in words]
+    np.testing.assert_array_equal(fast_array, syllables_per_word(words))
@@ -0,0 +1,14 @@
+from core.analyze._tokenize import _TRANSLATE_MIN_LEN, _WORD_RE_RUCYR, extract_words_lower
+
+
+def test_extract_words_lower_fast_path_matches_regex(random_texts):
+    long_texts = [t.lower() for t in random_texts if len(t) >= _TRANSLATE_MIN_LEN]
+    assert len(long_texts) > 100
+    for text_lower in long_texts:
+        assert extract_words_lower(text_lower) == _WORD_RE_RUCYR.findall(text_lower), text_lower
+
+
+def test_extract_words_lower_hyphens_and_mixed_tokens():
+    padding = " " * _TRANSLATE_MIN_LEN
+    text = "-мама- мама--папа пре-красно x-мама мама-x 5мама мама5 ёж_ ёж" + padding
+    assert extract_words_lower(text) == _WORD_RE_RUCYR.findall(text)